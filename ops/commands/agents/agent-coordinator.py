@@ -13,13 +13,15 @@ Usage:
 """
 
 import argparse
-import json
 import re
 import subprocess
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List
+
+# Task lines: - [x] T001 [P] @agent Description in path/to/file
+TASK_PATTERN = re.compile(r'- \[([x ])\] (T\d+)(?:\s+\[P\])?\s*@(\w+)\s+(.+?)(?:\s+in\s+(.+?))?(?:\n|$)')
 
 
 @dataclass
@@ -53,10 +55,7 @@ class AgentCoordinator:
         with open(self.tasks_file, 'r') as f:
             content = f.read()
             
-        # Regex to match task lines: - [x] T001 @agent Description
-        task_pattern = r'- \[([x ])\] (T\d+)(?:\s+\[P\])?\s*@(\w+)\s+(.+?)(?:\s+in\s+(.+?))?(?:\n|$)'
-        
-        for match in re.finditer(task_pattern, content):
+        for match in TASK_PATTERN.finditer(content):
             completed = match.group(1) == 'x'
             task_id = match.group(2)
             agent = match.group(3)
@@ -111,7 +110,7 @@ class AgentCoordinator:
                 continue
                 
             # Check if all dependencies are completed
-            deps_ready = all(dep in completed_tasks for dep in task.dependencies)
+            deps_ready = completed_tasks.issuperset(task.dependencies)
             if deps_ready:
                 ready_tasks.append(task)
                 
@@ -210,7 +209,7 @@ class AgentCoordinator:
         ]
         
         print(f"[INFO] Calling Codex for {task.id}...")
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=300)
         
         if result.returncode == 0:
             print(f"[SUCCESS] Codex completed {task.id}")
@@ -227,7 +226,7 @@ class AgentCoordinator:
         ]
         
         print(f"[INFO] Calling Gemini for {task.id}...")
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300, cwd=self.working_dir)
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=300, cwd=self.working_dir)
         
         if result.returncode == 0:
             print(f"[SUCCESS] Gemini completed {task.id}")
@@ -5,7 +5,6 @@ Convert Heavy Equipment Mechanics JSON to CSV with LinkedIn URL column
 
 import json
 import csv
-from pathlib import Path
 
 def convert_json_to_csv():
     # Load the JSON data
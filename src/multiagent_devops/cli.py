@@ -3,9 +3,10 @@
 Multi-agent development workflow automation.
 """
 
+from importlib.metadata import version as installed_version
+
 import click
 import requests
-import pkg_resources
 from rich.console import Console
 
 console = Console()
@@ -72,7 +73,7 @@ def _get_latest_version(package_name):
 def _check_for_updates():
     """Check for DevOps updates"""
     try:
-        current_version = pkg_resources.get_distribution('multiagent-devops').version
+        current_version = installed_version('multiagent-devops')
         latest_version = _get_latest_version('multiagent-devops')
         
         if latest_version and current_version != latest_version: